@@ -0,0 +1,18 @@
+"""Single-shot .env loading shared by the test scripts.
+
+Each module that called load_dotenv() at import re-parsed the .env file
+and re-merged it into os.environ; when several of them get imported in
+one process (e.g., pytest collection) that work repeats per module. This
+guard makes the first caller pay the parse and every later call a no-op.
+"""
+
+_loaded = False
+
+def ensure_loaded() -> None:
+    """Load the .env file into os.environ, at most once per process."""
+    global _loaded
+    if _loaded:
+        return
+    from dotenv import load_dotenv
+    load_dotenv()
+    _loaded = True
@@ -0,0 +1,70 @@
+"""Buffered status reporting shared by the test scripts.
+
+The scripts used to emit every status line with its own print call -
+dozens of flushed write syscalls per run once stdout is a TTY or a
+capture pipe. A Reporter collects the lines and writes them in one go
+when flushed; flush is also registered with atexit so buffered output
+survives an unexpected exit.
+"""
+
+import atexit
+import json
+import os
+import sys
+import uuid
+
+_BAR = "=" * 60
+
+# Where the machine-readable result files land
+RESULTS_DIR = "test-results"
+
+def write_results(prefix, records):
+    """Write test records as JSON for cross-shard aggregation.
+
+    Args:
+        prefix: Result-file prefix naming the script (e.g., "gemini").
+        records: List of {"name", "passed", "duration_ms"} dicts.
+
+    Returns:
+        Path of the written file, or None on failure.
+    """
+    if not records:
+        return None
+    try:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f"{prefix}-{uuid.uuid4().hex}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(records, f)
+        return path
+    except OSError:
+        return None
+
+class Reporter:
+    """Collects status lines and emits them with a single write."""
+
+    def __init__(self):
+        self.buf = []
+        atexit.register(self.flush)
+
+    def header(self, text):
+        self.buf.append(f"\n{_BAR}\n  {text}\n{_BAR}\n")
+
+    def success(self, text):
+        self.buf.append(f"✓ {text}")
+
+    def error(self, text):
+        self.buf.append(f"✗ {text}")
+
+    def info(self, text):
+        self.buf.append(f"ℹ {text}")
+
+    def line(self, text=""):
+        self.buf.append(text)
+
+    def flush(self):
+        """Write all buffered lines as one syscall and clear the buffer."""
+        if not self.buf:
+            return
+        sys.stdout.write("\n".join(self.buf) + "\n")
+        sys.stdout.flush()
+        self.buf.clear()
@@ -2,14 +2,22 @@
 
 import os
 import sys
+import asyncio
 import logging
+import threading
 import uuid
 import gradio as gr
 
 from modules.data_extraction import extract_linkedin_profile
-from modules.data_processing import split_profile_data, create_vector_database, verify_embeddings
+from modules.data_processing import split_profile_data, acreate_vector_database, load_vector_database, verify_embeddings, refresh_session_ttl
 from modules.llm_interface import change_llm_model
-from modules.query_engine import generate_initial_facts, answer_user_query
+from modules.query_engine import (
+    generate_initial_facts,
+    retrieve_facts_context,
+    synthesize_initial_facts,
+    stream_user_query,
+)
+from modules import semantic_cache
 import config
 
 # Set up logging
@@ -23,33 +31,134 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-# Dictionary to store active conversations
-active_indices = {}
+# Try to import cachetools for a bounded session store, fall back to a
+# plain dict if unavailable
+try:
+    from cachetools import TTLCache
+    CACHETOOLS_AVAILABLE = True
+except ImportError:
+    CACHETOOLS_AVAILABLE = False
+
+# Store for active conversations. Bounded LRU with TTL so idle sessions
+# expire and memory stays capped instead of growing with every profile
+# ever processed; evicted sessions can still be rehydrated from Redis
+# when it is configured.
+if CACHETOOLS_AVAILABLE:
+    active_indices = TTLCache(maxsize=config.MAX_ACTIVE_SESSIONS, ttl=config.SESSION_TTL)
+else:
+    active_indices = {}
+
+# Gradio's queue is multithreaded, so guard cache access
+active_indices_lock = threading.RLock()
+
+# Gemini models offered in the UI dropdown
+AVAILABLE_MODELS = [
+    "gemini-2.5-flash",
+    "gemini-2.5-pro",
+    "gemini-1.5-flash",
+    "gemini-1.5-pro",
+]
+
+# In-flight process_profile calls keyed by (url, use_mock, model), so
+# concurrent identical requests await one pipeline run instead of each
+# paying for extraction and embedding
+_inflight = {}
 
-def process_profile(linkedin_url, linkedin_email, linkedin_password, use_mock, selected_model):
+# Maps (url, use_mock) to the session that already indexed that profile.
+# Embeddings are model-independent, so re-processing the same URL with a
+# different generation model can reuse the existing index. Bounded with
+# the same TTL as active_indices - once the session it points to has
+# expired the mapping is useless, and an unbounded dict would grow with
+# every distinct URL ever processed.
+if CACHETOOLS_AVAILABLE:
+    _url_sessions = TTLCache(maxsize=config.MAX_ACTIVE_SESSIONS, ttl=config.SESSION_TTL)
+else:
+    _url_sessions = {}
+
+async def process_profile(linkedin_url, linkedin_email, linkedin_password, use_mock, selected_model):
     """Process a LinkedIn profile and generate initial facts.
-    
+
+    Concurrent calls for the same profile are coalesced: the first call
+    runs the pipeline, later callers await its result.
+
     Args:
         linkedin_url: LinkedIn profile URL to process.
         linkedin_email: LinkedIn account email (optional).
         linkedin_password: LinkedIn account password (optional).
         use_mock: Whether to use mock data.
         selected_model: LLM model to use.
-        
+
+    Returns:
+        Initial facts about the profile and a session ID for this conversation.
+    """
+    key = (linkedin_url, use_mock, selected_model)
+
+    existing = _inflight.get(key)
+    if existing is not None:
+        # Someone else is already processing this exact profile - share
+        # their result (including the session ID) instead of re-running
+        # extraction and embedding
+        return await asyncio.shield(existing)
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = await _process_profile_impl(
+            linkedin_url, linkedin_email, linkedin_password, use_mock, selected_model
+        )
+        future.set_result(result)
+        return result
+    except Exception as e:
+        future.set_result((f"Error: {str(e)}", None))
+        raise
+    finally:
+        _inflight.pop(key, None)
+        # CancelledError is a BaseException, so the except above never
+        # sees it - if the leader's request was cancelled, cancel the
+        # shared future too instead of leaving followers awaiting forever
+        if not future.done():
+            future.cancel()
+
+async def _process_profile_impl(linkedin_url, linkedin_email, linkedin_password, use_mock, selected_model):
+    """Run the full profile pipeline.
+
+    Runs as a coroutine (Gradio awaits it natively) so the blocking
+    extraction and LLM calls happen in worker threads and the embedding
+    batch is issued concurrently, keeping the event loop free to service
+    other users.
+
     Returns:
         Initial facts about the profile and a session ID for this conversation.
     """
     try:
         # Change LLM model if needed
-        if selected_model != config.LLM_MODEL_ID:
+        model_changed = selected_model != config.LLM_MODEL_ID
+        if model_changed:
             change_llm_model(selected_model)
-            
+
         # Use a default URL for mock data if none provided
         if use_mock and not linkedin_url:
             linkedin_url = "https://www.linkedin.com/in/williamhgates/"
-            
-        # Extract profile data
-        profile_data = extract_linkedin_profile(
+
+        # If this profile was already indexed, reuse the existing index -
+        # a model-only change does not require re-extracting or
+        # re-embedding anything
+        url_key = (linkedin_url, use_mock)
+        with active_indices_lock:
+            cached_session = _url_sessions.get(url_key)
+            index = active_indices.get(cached_session) if cached_session else None
+        if index is not None:
+            logger.info(f"Reusing existing index for {linkedin_url}")
+            if model_changed:
+                # Cached answers came from the previous model - drop them
+                # so the user's model selection actually takes effect
+                semantic_cache.clear(cached_session)
+            facts = await asyncio.to_thread(generate_initial_facts, index)
+            return f"Profile processed successfully!\n\nHere are 3 interesting facts about this person:\n\n{facts}", cached_session
+
+        # Extract profile data (network-bound, run off the event loop)
+        profile_data = await asyncio.to_thread(
+            extract_linkedin_profile,
             linkedin_url,
             linkedin_email=linkedin_email if not use_mock else None,
             linkedin_password=linkedin_password if not use_mock else None,
@@ -70,24 +179,48 @@ def process_profile(linkedin_url, linkedin_email, linkedin_password, use_mock, s
         if not nodes:
             return "Failed to process profile data into nodes.", None
         
-        # Create vector database
-        index = create_vector_database(nodes)
-        
+        # Generate a unique session ID
+        session_id = str(uuid.uuid4())
+
+        # Build the index over the leading nodes first - the facts prompt
+        # only needs the top-K chunks, so its LLM call can overlap with
+        # embedding the rest of the profile
+        head = nodes[:config.FACTS_HEAD_NODES]
+        tail = nodes[config.FACTS_HEAD_NODES:]
+
+        # Create vector database (stored in Redis when configured),
+        # embedding all nodes concurrently
+        index = await acreate_vector_database(head, session_id=session_id)
+
         if not index:
             return "Failed to create vector database.", None
-        
-        # Verify embeddings
-        if not verify_embeddings(index):
+
+        # Retrieve the facts context before touching the index again -
+        # the default stores are not safe to read while insert_nodes
+        # mutates them, so only the LLM synthesis overlaps the tail embed
+        facts_context = await asyncio.to_thread(retrieve_facts_context, index)
+
+        # Kick off facts synthesis while the remaining nodes embed
+        facts_task = asyncio.create_task(
+            asyncio.to_thread(synthesize_initial_facts, facts_context)
+        )
+
+        if tail:
+            await asyncio.to_thread(index.insert_nodes, tail)
+            # The tail's document keys were written after the store's TTL
+            # pass - re-apply it so they expire with the rest of the session
+            await asyncio.to_thread(refresh_session_ttl, session_id)
+
+        # Verify embeddings (debug-only sanity check)
+        if config.DEBUG and not verify_embeddings(index):
             logger.warning("Some embeddings may be missing or invalid")
-        
-        # Generate initial facts
-        facts = generate_initial_facts(index)
-        
-        # Generate a unique session ID
-        session_id = str(uuid.uuid4())
-        
-        # Store the index for this session
-        active_indices[session_id] = index
+
+        facts = await facts_task
+
+        # Store the index for this session and remember which URL it indexed
+        with active_indices_lock:
+            active_indices[session_id] = index
+            _url_sessions[url_key] = session_id
         
         # Return the facts and session ID
         return f"Profile processed successfully!\n\nHere are 3 interesting facts about this person:\n\n{facts}", session_id
@@ -97,49 +230,76 @@ def process_profile(linkedin_url, linkedin_email, linkedin_password, use_mock, s
         return f"Error: {str(e)}", None
 
 def chat_with_profile(session_id, user_query, chat_history):
-    """Chat with a processed LinkedIn profile.
-    
+    """Chat with a processed LinkedIn profile, streaming the answer.
+
+    Implemented as a generator so Gradio can update the Chatbot as tokens
+    arrive from Gemini - perceived latency becomes time-to-first-token
+    instead of the full completion time.
+
     Args:
         session_id: Session ID for this conversation.
         user_query: User's question.
         chat_history: Chat history.
-        
-    Returns:
+
+    Yields:
         Updated chat history and cleared input.
     """
     if not session_id:
-        return chat_history + [[user_query, "No profile loaded. Please process a LinkedIn profile first."]], ""
-    
-    if session_id not in active_indices:
-        return chat_history + [[user_query, "Session expired. Please process the LinkedIn profile again."]], ""
-    
+        yield chat_history + [[user_query, "No profile loaded. Please process a LinkedIn profile first."]], ""
+        return
+
+    with active_indices_lock:
+        index = active_indices.get(session_id)
+
+    if index is None:
+        # Not in local memory - try to rehydrate from the Redis store
+        # (another replica may have processed this profile, or the session
+        # was evicted locally)
+        index = load_vector_database(session_id)
+        if index:
+            with active_indices_lock:
+                active_indices[session_id] = index
+        else:
+            # The session is gone everywhere - drop its semantic cache too
+            semantic_cache.clear(session_id)
+            yield chat_history + [[user_query, "Session expired. Please process the LinkedIn profile again."]], ""
+            return
+
     if not user_query.strip():
-        return chat_history, ""
-    
+        yield chat_history, ""
+        return
+
     try:
-        # Get the index for this session
-        index = active_indices[session_id]
-        
-        # Answer the user's query
-        response = answer_user_query(index, user_query)
-        
-        # Update chat history
-        return chat_history + [[user_query, response.response]], ""
-    
+        # Check the semantic cache first - a similar question may already
+        # have been answered, skipping the whole LLM round trip
+        query_embedding, cached_response = semantic_cache.lookup(session_id, user_query)
+        if cached_response is not None:
+            yield chat_history + [[user_query, cached_response]], ""
+            return
+
+        # Stream the answer token by token, reusing the embedding the
+        # semantic cache already computed for this query
+        response = stream_user_query(index, user_query,
+                                     query_embedding=query_embedding)
+
+        if hasattr(response, "response_gen"):
+            partial = ""
+            for token in response.response_gen:
+                partial += token
+                yield chat_history + [[user_query, partial]], ""
+            semantic_cache.store(session_id, query_embedding, partial)
+        else:
+            # Non-streaming fallback (e.g., error response)
+            yield chat_history + [[user_query, response.response]], ""
+
     except Exception as e:
         logger.error(f"Error in chat_with_profile: {e}")
-        return chat_history + [[user_query, f"Error: {str(e)}"]], ""
+        yield chat_history + [[user_query, f"Error: {str(e)}"]], ""
 
 def create_gradio_interface():
     """Create the Gradio interface for the Icebreaker Bot."""
-    # Define available Gemini models
-    available_models = [
-        "gemini-2.5-flash",
-        "gemini-2.5-pro",
-        "gemini-1.5-flash",
-        "gemini-1.5-pro",
-    ]
-    
+    available_models = AVAILABLE_MODELS
+
     with gr.Blocks(title="LinkedIn Icebreaker Bot") as demo:
         gr.Markdown(
             """
@@ -225,7 +385,8 @@ def create_gradio_interface():
             process_btn.click(
                 fn=process_profile,
                 inputs=[linkedin_url, linkedin_email, linkedin_password, use_mock, model_dropdown],
-                outputs=[result_text, session_id]
+                outputs=[result_text, session_id],
+                concurrency_id="llm"
             )
         
         with gr.Tab("💬 Chat"):
@@ -265,13 +426,15 @@ def create_gradio_interface():
             chat_btn.click(
                 fn=chat_with_profile,
                 inputs=[session_id, chat_input, chatbot],
-                outputs=[chatbot, chat_input]
+                outputs=[chatbot, chat_input],
+                concurrency_id="llm"
             )
-            
+
             chat_input.submit(
                 fn=chat_with_profile,
                 inputs=[session_id, chat_input, chatbot],
-                outputs=[chatbot, chat_input]
+                outputs=[chatbot, chat_input],
+                concurrency_id="llm"
             )
         
         with gr.Tab("ℹ️ About"):
@@ -335,7 +498,26 @@ if __name__ == "__main__":
         print("="*60 + "\n")
     
     demo = create_gradio_interface()
-    
+
+    # Warm the LLM client cache in the background so the first user click
+    # hits a hot client for any model in the dropdown
+    if config.GEMINI_API_KEY:
+        from modules.llm_interface import warm_llm_cache
+        threading.Thread(
+            target=warm_llm_cache, args=(AVAILABLE_MODELS,), daemon=True
+        ).start()
+
+    # Warm the JIT-compiled similarity kernels so the first chat message
+    # does not pay the Numba compile/cache-load cost
+    from modules import similarity
+    threading.Thread(target=similarity.warmup, daemon=True).start()
+
+    # Enable the queue so generator-based handlers stream partial updates
+    # and multiple sessions stream concurrently. All LLM-bound handlers
+    # share the "llm" concurrency pool, sized to the Gemini rate-limit
+    # budget; max_size caps how many requests can wait before rejection.
+    demo.queue(default_concurrency_limit=8, max_size=64, api_open=False)
+
     # Launch the Gradio interface
     print("\n" + "="*60)
     print("🚀 Starting LinkedIn Icebreaker Bot")
@@ -346,7 +528,9 @@ if __name__ == "__main__":
     print("="*60 + "\n")
     
     demo.launch(
-        server_name="0.0.0.0",  
+        server_name="0.0.0.0",
         server_port=5000,
-        share=True  # Creates a public link - set to False for local only
+        max_threads=32,
+        # Gradio's public tunnel adds latency per request - opt in via env
+        share=os.environ.get("GRADIO_SHARE") == "1"
     )
\ No newline at end of file
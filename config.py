@@ -56,6 +56,13 @@ LINKEDIN_PASSWORD = os.environ.get("LINKEDIN_PASSWORD")
 # Note: Using your LinkedIn credentials is optional
 # If not provided, the app will use mock data automatically
 
+# ProxyCurl API key (optional legacy backend - mock data works without it)
+PROXYCURL_API_KEY = os.environ.get("PROXYCURL_API_KEY")
+
+# Which extraction backend to use: "linkedin-api" (free, default) or
+# "proxycurl" (paid API, see modules/data_extraction_proxycurl.py)
+EXTRACTOR_BACKEND = os.environ.get("EXTRACTOR_BACKEND", "linkedin-api")
+
 # ============================================================================
 # Vector Database Configuration
 # ============================================================================
@@ -69,6 +76,46 @@ CHUNK_OVERLAP = 50
 # Number of similar chunks to retrieve
 SIMILARITY_TOP_K = 3
 
+# Nodes embedded per request - Gemini's batchEmbedContents endpoint
+# accepts up to 100 inputs, so a typical profile embeds in one call
+EMBED_BATCH_SIZE = 100
+
+# Store embeddings int8-quantized in FAISS (4x less memory per vector).
+# Requires faiss-cpu and llama-index-vector-stores-faiss to be installed.
+QUANTIZE_EMBEDDINGS = os.environ.get("QUANTIZE_EMBEDDINGS") == "1"
+
+# Number of leading nodes indexed before the initial facts generation is
+# kicked off; the remaining nodes embed while the LLM call is in flight
+FACTS_HEAD_NODES = 16
+
+# ============================================================================
+# Session Store Configuration
+# ============================================================================
+
+# Redis connection URL for a shared, persistent session store
+# (e.g., "redis://localhost:6379"). When set, vector indices are stored in
+# Redis so multiple app replicas can share sessions and state survives
+# restarts. Leave unset to keep sessions in process memory.
+REDIS_URL = os.environ.get("REDIS_URL")
+
+# How long (in seconds) a session's vector index is kept alive
+SESSION_TTL = 3600
+
+# Maximum number of in-memory session indices kept at once; the oldest
+# sessions are evicted when the limit is reached
+MAX_ACTIVE_SESSIONS = 256
+
+# ============================================================================
+# Semantic Cache Configuration
+# ============================================================================
+
+# Maximum number of (query embedding, response) pairs cached per session
+SEMANTIC_CACHE_SIZE = 256
+
+# Minimum cosine similarity between a new query and a cached query for
+# the cached response to be reused
+SEMANTIC_CACHE_THRESHOLD = 0.9
+
 # ============================================================================
 # Application Configuration
 # ============================================================================
@@ -76,12 +123,19 @@ SIMILARITY_TOP_K = 3
 # Directory for storing mock data
 MOCK_DATA_DIR = "mock_data"
 
+# How long (in seconds) scraped profiles are served from the on-disk
+# cache before being re-fetched
+PROFILE_CACHE_TTL = 86400
+
 # Mock data URL (fallback if local file not found)
 MOCK_DATA_URL = "https://gist.githubusercontent.com/emarco177/0d6a3f93dd06634d95e46a2782ed7490/raw/fad4d7a87e3e934ad52ba2a968bad9eb45128665/eden-marco.json"
 
 # Logging level
 LOG_LEVEL = "INFO"
 
+# Enable extra debug checks (e.g., the post-build embedding scan)
+DEBUG = os.environ.get("ICEBREAKER_DEBUG") == "1"
+
 # ============================================================================
 # Prompt Templates
 # ============================================================================
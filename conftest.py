@@ -0,0 +1,67 @@
+"""Shared pytest configuration for the test scripts.
+
+Registers the --profile-url option so the LinkedIn profile-fetch test is
+non-interactive (and therefore parallelizable under pytest-xdist)
+instead of prompting via input() like the standalone script does, and
+provides session-scoped client fixtures so expensive setup (LinkedIn
+login, Gemini client construction) happens once per pytest session
+rather than once per test.
+"""
+
+import os
+
+import pytest
+
+from _env import ensure_loaded
+
+ensure_loaded()
+
+# Default public profile used when --profile-url is not supplied
+DEFAULT_PROFILE_URL = "https://www.linkedin.com/in/williamhgates/"
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--profile-url",
+        action="store",
+        default=DEFAULT_PROFILE_URL,
+        help="LinkedIn profile URL used by the profile-fetch tests",
+    )
+
+@pytest.fixture
+def profile_url(request):
+    """The LinkedIn profile URL under test."""
+    return request.config.getoption("--profile-url")
+
+@pytest.fixture(scope="session")
+def linkedin_api():
+    """Authenticated Linkedin client, logged in once per session."""
+    email = os.environ.get("LINKEDIN_EMAIL")
+    password = os.environ.get("LINKEDIN_PASSWORD")
+    if not email or not password:
+        pytest.skip("LinkedIn credentials not configured in .env")
+
+    from linkedin_api import Linkedin
+    # Cookie cache lets repeated sessions skip the login handshake
+    return Linkedin(email, password,
+                    refresh_cookies=False, cookies_dir="./.linkedin_cache/")
+
+@pytest.fixture(scope="session")
+def gemini_llm():
+    """Gemini LLM client, constructed once per session."""
+    api_key = os.environ.get("GEMINI_API_KEY")
+    if not api_key:
+        pytest.skip("GEMINI_API_KEY not configured in .env")
+
+    from llama_index.llms.google_genai import GoogleGenAI
+    return GoogleGenAI(model="gemini-2.5-flash", api_key=api_key)
+
+@pytest.fixture(scope="session")
+def gemini_embed():
+    """Gemini embedding client, constructed once per session."""
+    api_key = os.environ.get("GEMINI_API_KEY")
+    if not api_key:
+        pytest.skip("GEMINI_API_KEY not configured in .env")
+
+    from llama_index.embeddings.google_genai import GoogleGenAIEmbedding
+    return GoogleGenAIEmbedding(model_name="models/text-embedding-004",
+                                api_key=api_key)
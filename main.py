@@ -48,8 +48,8 @@ def process_linkedin(linkedin_url, api_key=None, mock=False):
             logger.error("Failed to create vector database.")
             return
         
-        # Verify embeddings
-        if not verify_embeddings(vectordb_index):
+        # Verify embeddings (debug-only sanity check)
+        if config.DEBUG and not verify_embeddings(vectordb_index):
             logger.warning("Some embeddings may be missing or invalid.")
         
         # Generate and display the initial facts
@@ -2,9 +2,16 @@
 
 import time
 import json
+import hashlib
 import os
+import pickle
+import re
 import logging
-from typing import Dict, Optional, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Dict, List, Optional, Any
+
+import requests
 
 # Try to import linkedin_api, if not available fall back to mock data
 try:
@@ -14,47 +21,201 @@ except ImportError:
     LINKEDIN_API_AVAILABLE = False
     print("⚠️  linkedin_api not installed. Install with: pip install linkedin-api")
 
+# Try to import httpx for a pooled HTTP/2 client, fall back to requests
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Try to import backoff for exponential-backoff retries
+try:
+    import backoff
+    BACKOFF_AVAILABLE = True
+except ImportError:
+    BACKOFF_AVAILABLE = False
+
+# Try to import orjson for faster parsing of the dense profile payloads
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _loads(data) -> Any:
+    """Parse a JSON payload (bytes or str) with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+    return json.loads(data)
+
+def _dumps(obj) -> bytes:
+    """Serialize an object to JSON bytes with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
 import config
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP client so consecutive fetches reuse keep-alive connections
+# instead of paying a fresh TCP+TLS handshake per call
+_http_client = None
+
+def _get_http_client():
+    """Get the shared pooled HTTP client, or None if httpx is unavailable."""
+    global _http_client
+    if not HTTPX_AVAILABLE:
+        return None
+    if _http_client is None:
+        limits = httpx.Limits(max_keepalive_connections=10)
+        try:
+            _http_client = httpx.Client(http2=True, timeout=30.0, limits=limits)
+        except ImportError:
+            # http2 extra (h2) not installed - pooling still applies
+            _http_client = httpx.Client(timeout=30.0, limits=limits)
+    return _http_client
+
+def _http_get(url: str):
+    """Issue a GET through the pooled client, falling back to requests."""
+    client = _get_http_client()
+    if client is not None:
+        return client.get(url)
+    return requests.get(url, timeout=30)
+
+# Hardcoded fallback profile, built once at import instead of
+# reconstructing the large dict literal on every call
+_HARDCODED_MOCK = {
+    "full_name": "Eden Marco",
+    "headline": "AI Engineer | Building Intelligent Systems",
+    "summary": "Passionate about AI, machine learning, and building systems that make a difference. Experienced in Python, NLP, and computer vision.",
+    "location": "Tel Aviv, Israel",
+    "country": "Israel",
+    "experiences": [
+        {
+            "title": "Senior AI Engineer",
+            "company": "Tech Innovations Ltd",
+            "location": "Tel Aviv",
+            "starts_at": {"year": 2020, "month": 1},
+            "ends_at": None,
+            "description": "Leading AI projects in natural language processing and computer vision"
+        },
+        {
+            "title": "Machine Learning Engineer",
+            "company": "DataCorp",
+            "location": "Tel Aviv",
+            "starts_at": {"year": 2018, "month": 6},
+            "ends_at": {"year": 2019, "month": 12},
+            "description": "Developed ML models for predictive analytics"
+        }
+    ],
+    "education": [
+        {
+            "school": "Tel Aviv University",
+            "degree": "Bachelor of Science",
+            "field_of_study": "Computer Science",
+            "starts_at": {"year": 2014},
+            "ends_at": {"year": 2018}
+        }
+    ],
+    "skills": [
+        "Python",
+        "Machine Learning",
+        "Deep Learning",
+        "Natural Language Processing",
+        "Computer Vision",
+        "TensorFlow",
+        "PyTorch",
+        "Docker",
+        "Kubernetes"
+    ]
+}
+
+def _profile_cache_path(linkedin_profile_url: str) -> str:
+    """Build the on-disk cache path for a profile URL."""
+    key = hashlib.sha1(linkedin_profile_url.encode('utf-8')).hexdigest()
+    return os.path.join(config.MOCK_DATA_DIR, "cache", f"{key}.json")
+
+def _load_cached_profile(linkedin_profile_url: str) -> Optional[Dict[str, Any]]:
+    """Return a cached profile for the URL if it exists and is fresh."""
+    cache_path = _profile_cache_path(linkedin_profile_url)
+    try:
+        if not os.path.exists(cache_path):
+            return None
+        with open(cache_path, 'rb') as f:
+            payload = _loads(f.read())
+        if time.time() - payload.get("fetched_at", 0) > config.PROFILE_CACHE_TTL:
+            return None
+        logger.info("Using cached profile for %s", linkedin_profile_url)
+        return payload.get("profile")
+    except Exception as e:
+        logger.warning("Could not read profile cache: %s", e)
+        return None
+
+def _store_cached_profile(linkedin_profile_url: str, profile: Dict[str, Any]) -> None:
+    """Persist a scraped profile to the on-disk cache."""
+    cache_path = _profile_cache_path(linkedin_profile_url)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            f.write(_dumps({"fetched_at": time.time(), "profile": profile}))
+    except OSError as e:
+        logger.warning("Could not write profile cache: %s", e)
+
 def extract_linkedin_profile(
-    linkedin_profile_url: str, 
+    linkedin_profile_url: str,
     linkedin_email: Optional[str] = None,
     linkedin_password: Optional[str] = None,
-    mock: bool = False
+    mock: bool = False,
+    force_refresh: bool = False
 ) -> Dict[str, Any]:
     """Extract LinkedIn profile data using linkedin-api or mock data.
-    
+
     Args:
         linkedin_profile_url: The LinkedIn profile URL to extract data from.
         linkedin_email: LinkedIn account email (optional, for real scraping).
         linkedin_password: LinkedIn account password (optional, for real scraping).
         mock: If True, loads mock data instead of scraping.
-    
+        force_refresh: If True, bypasses the on-disk profile cache.
+
     Returns:
         Dictionary containing the LinkedIn profile data.
     """
     start_time = time.time()
-    
+
     try:
         if mock:
             logger.info("Using mock data from file...")
             return load_mock_data()
-        
+
+        # Dispatch to the ProxyCurl backend when configured, keeping a
+        # single public extraction entry point
+        if getattr(config, "EXTRACTOR_BACKEND", "linkedin-api") == "proxycurl":
+            from modules import data_extraction_proxycurl
+            return data_extraction_proxycurl.extract_linkedin_profile(linkedin_profile_url)
+
+        # A repeat run for the same URL within the TTL skips the whole
+        # authentication + scrape round trip
+        if not force_refresh:
+            cached_profile = _load_cached_profile(linkedin_profile_url)
+            if cached_profile:
+                return cached_profile
+
         # Check if linkedin_api is available
         if not LINKEDIN_API_AVAILABLE:
             logger.error("linkedin_api not installed. Install it with: pip install linkedin-api")
             logger.warning("Falling back to mock data")
             return load_mock_data()
-        
+
         # Extract username from LinkedIn URL
         username = extract_username_from_url(linkedin_profile_url)
         if not username:
-            logger.error(f"Could not extract username from LinkedIn URL: {linkedin_profile_url}")
+            logger.error("Could not extract username from LinkedIn URL: %s", linkedin_profile_url)
             logger.info("Falling back to mock data")
             return load_mock_data()
-        
+
         # Get credentials from environment or parameters
         email = linkedin_email or os.environ.get("LINKEDIN_EMAIL")
         password = linkedin_password or os.environ.get("LINKEDIN_PASSWORD")
@@ -65,38 +226,40 @@ def extract_linkedin_profile(
             logger.info("Falling back to mock data")
             return load_mock_data()
         
-        logger.info(f"Attempting to authenticate with LinkedIn as: {email}")
+        logger.info("Attempting to authenticate with LinkedIn as: %s", email)
         
         
-        logger.info(f"Extracting LinkedIn profile for username: {username}")
+        logger.info("Extracting LinkedIn profile for username: %s", username)
         
         try:
-            # Authenticate with LinkedIn
-            logger.info("Authenticating with LinkedIn...")
-            api = Linkedin(email, password)
-            logger.info("✓ Authentication successful!")
-            
+            # Authenticate with LinkedIn (reuses a cached session when
+            # this account has already logged in)
+            api = _get_linkedin_client(email, password)
+
             # Get profile data
-            logger.info(f"Fetching profile data for '{username}' at {time.time() - start_time:.2f} seconds...")
-            profile_data = api.get_profile(username)
+            logger.info("Fetching profile data for '%s' at %.2f seconds...", username, time.time() - start_time)
+            profile_data = _get_profile_with_retry(api, username)
             
             if not profile_data:
-                logger.error(f"No data returned for profile: {username}")
+                logger.error("No data returned for profile: %s", username)
                 logger.info("Falling back to mock data")
                 return load_mock_data()
             
-            logger.info(f"✓ Successfully extracted profile data in {time.time() - start_time:.2f} seconds")
+            logger.info("✓ Successfully extracted profile data in %.2f seconds", time.time() - start_time)
             
             # Clean and format the data
             cleaned_data = clean_profile_data(profile_data)
-            
+
             # Log what we got
-            logger.info(f"Extracted profile: {cleaned_data.get('full_name', 'Unknown')}")
-            
+            logger.info("Extracted profile: %s", cleaned_data.get('full_name', 'Unknown'))
+
+            # Cache so repeat runs for this URL skip the scrape
+            _store_cached_profile(linkedin_profile_url, cleaned_data)
+
             return cleaned_data
             
         except Exception as auth_error:
-            logger.error(f"LinkedIn API error: {str(auth_error)}")
+            logger.error("LinkedIn API error: %s", str(auth_error))
             
             # Check for specific errors
             error_msg = str(auth_error).lower()
@@ -114,117 +277,274 @@ def extract_linkedin_profile(
                     "message": "LinkedIn rate limit reached. Please wait an hour and try again, or use mock data."
                 }
             elif "404" in error_msg or "not found" in error_msg:
-                logger.error(f"❌ Profile not found: {username}")
+                logger.error("❌ Profile not found: %s", username)
                 return {
                     "error": "Profile not found",
                     "message": f"LinkedIn profile '{username}' not found. Check the URL or try a public profile."
                 }
             else:
-                logger.error(f"❌ Unexpected error: {auth_error}")
+                logger.error("❌ Unexpected error: %s", auth_error)
                 logger.info("Falling back to mock data")
                 return load_mock_data()
             
     except Exception as e:
-        logger.error(f"Error in extract_linkedin_profile: {e}")
+        logger.error("Error in extract_linkedin_profile: %s", e)
         logger.info("Falling back to mock data")
         return load_mock_data()
 
+# Authenticated Linkedin clients keyed by account email, so repeat
+# extractions reuse the session cookies instead of paying the full login
+# round trip (plus the library's built-in evasion sleep) every call
+_LI_CLIENTS: Dict[str, "Linkedin"] = {}
+
+# Session cookies persisted here so a fresh process can skip the login
+# handshake entirely by handing the saved cookie jar back to Linkedin()
+_COOKIE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "icebreaker")
+
+def _cookie_path(email: str) -> str:
+    """Build the on-disk cookie-jar path for a LinkedIn account."""
+    key = hashlib.sha1(email.encode('utf-8')).hexdigest()
+    return os.path.join(_COOKIE_DIR, f"li_cookies_{key}.pkl")
+
+def _load_cookies(email: str):
+    """Load a pickled cookie jar for the account, or None if unavailable."""
+    cookie_path = _cookie_path(email)
+    try:
+        if not os.path.exists(cookie_path):
+            return None
+        with open(cookie_path, 'rb') as f:
+            return pickle.load(f)
+    except Exception as e:
+        logger.warning("Could not load LinkedIn cookies: %s", e)
+        return None
+
+def _save_cookies(email: str, cookies) -> None:
+    """Persist the account's session cookie jar to disk."""
+    cookie_path = _cookie_path(email)
+    try:
+        os.makedirs(_COOKIE_DIR, exist_ok=True)
+        with open(cookie_path, 'wb') as f:
+            pickle.dump(cookies, f)
+    except OSError as e:
+        logger.warning("Could not save LinkedIn cookies: %s", e)
+
+def _get_linkedin_client(email: str, password: str) -> "Linkedin":
+    """Get (or authenticate and cache) a Linkedin client for the account.
+
+    Tries saved session cookies first so a new process reuses the prior
+    login instead of re-running the authentication handshake (and the
+    library's built-in evasion sleep); falls back to a fresh login when
+    the cookies are missing or rejected.
+
+    Args:
+        email: LinkedIn account email.
+        password: LinkedIn account password.
+
+    Returns:
+        Authenticated Linkedin client instance.
+    """
+    client = _LI_CLIENTS.get(email)
+    if client is not None:
+        return client
+
+    cookies = _load_cookies(email)
+    if cookies is not None:
+        try:
+            logger.info("Reusing saved LinkedIn session cookies...")
+            client = Linkedin(email, password, cookies=cookies)
+        except Exception as e:
+            logger.warning("Saved LinkedIn cookies rejected, logging in afresh: %s", e)
+            client = None
+
+    if client is None:
+        logger.info("Authenticating with LinkedIn...")
+        client = Linkedin(email, password)
+        _save_cookies(email, client.client.session.cookies)
+        logger.info("✓ Authentication successful!")
+
+    _LI_CLIENTS[email] = client
+    return client
+
+def _is_permanent_linkedin_error(error: Exception) -> bool:
+    """Return True for errors that retrying cannot fix (auth, not found)."""
+    message = str(error).lower()
+    return any(marker in message for marker in
+               ("401", "unauthorized", "authentication", "404", "not found"))
+
+def _get_profile_with_retry(api: "Linkedin", username: str) -> Dict[str, Any]:
+    """Fetch one profile from the LinkedIn API."""
+    return api.get_profile(username)
+
+if BACKOFF_AVAILABLE:
+    # Retry transient failures (rate limits, 5xx, network blips) with
+    # exponential backoff + jitter instead of falling straight to mock
+    # data; give up immediately on auth errors and missing profiles
+    _get_profile_with_retry = backoff.on_exception(
+        backoff.expo,
+        Exception,
+        max_tries=5,
+        jitter=backoff.full_jitter,
+        giveup=_is_permanent_linkedin_error,
+    )(_get_profile_with_retry)
+
+def extract_linkedin_profiles(
+    urls: List[str],
+    linkedin_email: Optional[str] = None,
+    linkedin_password: Optional[str] = None,
+    max_workers: int = 4
+) -> Dict[str, Dict[str, Any]]:
+    """Extract multiple LinkedIn profiles concurrently.
+
+    get_profile is blocking network I/O (plus the library's mandatory
+    sleeps), so a small thread pool gives near-linear speedup for batch
+    use cases; authentication cost is paid once via the cached client.
+
+    Args:
+        urls: LinkedIn profile URLs to extract.
+        linkedin_email: LinkedIn account email (falls back to environment).
+        linkedin_password: LinkedIn account password (falls back to environment).
+        max_workers: Maximum concurrent fetches.
+
+    Returns:
+        Dictionary mapping each URL to its cleaned profile data (or an
+        empty dict for URLs that failed).
+    """
+    email = linkedin_email or os.environ.get("LINKEDIN_EMAIL")
+    password = linkedin_password or os.environ.get("LINKEDIN_PASSWORD")
+
+    if not LINKEDIN_API_AVAILABLE or not email or not password:
+        logger.warning("linkedin_api or credentials unavailable, extracting sequentially with fallbacks")
+        return {url: extract_linkedin_profile(url, email, password) for url in urls}
+
+    api = _get_linkedin_client(email, password)
+
+    def _fetch(url: str) -> Dict[str, Any]:
+        username = extract_username_from_url(url)
+        if not username:
+            logger.error("Could not extract username from LinkedIn URL: %s", url)
+            return {}
+        return clean_profile_data(_get_profile_with_retry(api, username))
+
+    results: Dict[str, Dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_fetch, url): url for url in urls}
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                results[url] = future.result()
+            except Exception as e:
+                logger.error("Failed to extract profile %s: %s", url, e)
+                results[url] = {}
+    return results
+
+# Matches the username segment of any LinkedIn profile URL form:
+# https://www.linkedin.com/in/username/, https://linkedin.com/in/username,
+# www.linkedin.com/in/username?param=...
+_LINKEDIN_URL_PATTERN = re.compile(r"/in/([^/?#]+)")
+
+@lru_cache(maxsize=1024)
 def extract_username_from_url(url: str) -> Optional[str]:
     """Extract username from LinkedIn profile URL.
-    
+
+    Pure function of its input, so results are memoized - retries and
+    batch loops resolving the same URL pay a dict probe instead of a
+    regex scan.
+
     Args:
         url: LinkedIn profile URL
-        
+
     Returns:
         Username string or None if extraction fails
     """
     try:
-        # Remove trailing slash
-        url = url.rstrip('/')
-        
-        # Handle different URL formats
-        # https://www.linkedin.com/in/username/
-        # https://linkedin.com/in/username
-        # www.linkedin.com/in/username
-        
-        if '/in/' in url:
-            username = url.split('/in/')[-1].split('/')[0].split('?')[0]
-            return username
-        
-        logger.error(f"Invalid LinkedIn URL format: {url}")
+        # Single compiled-regex scan instead of chained split passes
+        match = _LINKEDIN_URL_PATTERN.search(url or "")
+        if match:
+            return match.group(1)
+
+        logger.error("Invalid LinkedIn URL format: %s", url)
         return None
-        
+
     except Exception as e:
-        logger.error(f"Error extracting username from URL: {e}")
+        logger.error("Error extracting username from URL: %s", e)
         return None
 
+# Parsed mock profiles keyed by file path, stored as (mtime, data) so a
+# changed file on disk invalidates the entry
+_MOCK_CACHE: Dict[str, tuple] = {}
+
 def load_mock_data() -> Dict[str, Any]:
     """Load mock LinkedIn profile data.
-    
+
+    The parsed dict is memoized keyed by file mtime, so repeated fallbacks
+    to mock data skip the disk read and JSON parse entirely.
+
     Returns:
         Dictionary containing mock profile data
     """
     try:
         # Try to load from local file first
         mock_data_path = os.path.join(config.MOCK_DATA_DIR, "mock_profile.json")
-        
+
         if os.path.exists(mock_data_path):
-            logger.info(f"Loading mock data from {mock_data_path}")
-            with open(mock_data_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        
+            mtime = os.path.getmtime(mock_data_path)
+            cached = _MOCK_CACHE.get(mock_data_path)
+            if cached and cached[0] == mtime:
+                return cached[1]
+
+            logger.info("Loading mock data from %s", mock_data_path)
+            # Read bytes and parse with orjson when available
+            with open(mock_data_path, 'rb') as f:
+                data = _loads(f.read())
+            _MOCK_CACHE[mock_data_path] = (mtime, data)
+            return data
+
+        # Try the configured mock-data URL over the pooled client
+        if config.MOCK_DATA_URL:
+            try:
+                logger.info("Fetching mock data from %s", config.MOCK_DATA_URL)
+                response = _http_get(config.MOCK_DATA_URL)
+                response.raise_for_status()
+                # Parse the raw bytes directly, skipping the UTF-8 decode
+                # round trip that response.json() would do
+                data = _loads(response.content)
+
+                # Cache the payload on disk so later mock-mode sessions
+                # read the local file instead of hitting the network
+                try:
+                    os.makedirs(config.MOCK_DATA_DIR, exist_ok=True)
+                    with open(mock_data_path, 'wb') as f:
+                        f.write(_dumps(data))
+                    logger.info("Cached mock data to %s", mock_data_path)
+                except OSError as cache_error:
+                    logger.warning("Could not cache mock data: %s", cache_error)
+
+                return data
+            except Exception as fetch_error:
+                logger.warning("Could not fetch mock data from URL: %s", fetch_error)
+
         # Fallback to hardcoded mock data
         logger.info("Using hardcoded mock data")
-        return {
-            "full_name": "Eden Marco",
-            "headline": "AI Engineer | Building Intelligent Systems",
-            "summary": "Passionate about AI, machine learning, and building systems that make a difference. Experienced in Python, NLP, and computer vision.",
-            "location": "Tel Aviv, Israel",
-            "country": "Israel",
-            "experiences": [
-                {
-                    "title": "Senior AI Engineer",
-                    "company": "Tech Innovations Ltd",
-                    "location": "Tel Aviv",
-                    "starts_at": {"year": 2020, "month": 1},
-                    "ends_at": None,
-                    "description": "Leading AI projects in natural language processing and computer vision"
-                },
-                {
-                    "title": "Machine Learning Engineer",
-                    "company": "DataCorp",
-                    "location": "Tel Aviv",
-                    "starts_at": {"year": 2018, "month": 6},
-                    "ends_at": {"year": 2019, "month": 12},
-                    "description": "Developed ML models for predictive analytics"
-                }
-            ],
-            "education": [
-                {
-                    "school": "Tel Aviv University",
-                    "degree": "Bachelor of Science",
-                    "field_of_study": "Computer Science",
-                    "starts_at": {"year": 2014},
-                    "ends_at": {"year": 2018}
-                }
-            ],
-            "skills": [
-                "Python",
-                "Machine Learning",
-                "Deep Learning",
-                "Natural Language Processing",
-                "Computer Vision",
-                "TensorFlow",
-                "PyTorch",
-                "Docker",
-                "Kubernetes"
-            ]
-        }
+        return _HARDCODED_MOCK
         
     except Exception as e:
-        logger.error(f"Error loading mock data: {e}")
+        logger.error("Error loading mock data: %s", e)
         return {}
 
+def _dig(d: Any, *keys: str) -> Any:
+    """Walk nested dicts by key, returning None as soon as a step is missing.
+
+    Avoids the `.get(..., {}).get(...)` chains (and their throwaway {}
+    allocations) in the profile-cleaning loops.
+    """
+    for key in keys:
+        if not isinstance(d, dict):
+            return None
+        d = d.get(key)
+        if d is None:
+            return None
+    return d
+
 def clean_profile_data(profile_data: Dict[str, Any]) -> Dict[str, Any]:
     """Clean and format profile data to match expected structure.
     
@@ -239,28 +559,34 @@ def clean_profile_data(profile_data: Dict[str, Any]) -> Dict[str, Any]:
         # We need to transform it to match our expected structure
         
         cleaned = {
-            "full_name": profile_data.get("firstName", "") + " " + profile_data.get("lastName", ""),
+            # strip() so a profile with no name fields yields "" (which
+            # the empty-value filter below drops) instead of " "
+            "full_name": f'{profile_data.get("firstName", "")} {profile_data.get("lastName", "")}'.strip(),
             "headline": profile_data.get("headline", ""),
             "summary": profile_data.get("summary", ""),
             "location": profile_data.get("locationName", ""),
             "country": profile_data.get("geoCountryName", ""),
         }
         
-        # Extract experiences
+        # Extract experiences, resolving each nested date dict once per
+        # entry instead of repeating the .get chains per field
         experiences = []
         for exp in profile_data.get("experience", []):
+            time_period = exp.get("timePeriod")
+            start_date = _dig(time_period, "startDate")
+            end_date = _dig(time_period, "endDate")
             experience = {
                 "title": exp.get("title", ""),
                 "company": exp.get("companyName", ""),
                 "location": exp.get("locationName", ""),
                 "starts_at": {
-                    "year": exp.get("timePeriod", {}).get("startDate", {}).get("year"),
-                    "month": exp.get("timePeriod", {}).get("startDate", {}).get("month")
+                    "year": _dig(start_date, "year"),
+                    "month": _dig(start_date, "month")
                 },
                 "ends_at": {
-                    "year": exp.get("timePeriod", {}).get("endDate", {}).get("year"),
-                    "month": exp.get("timePeriod", {}).get("endDate", {}).get("month")
-                } if exp.get("timePeriod", {}).get("endDate") else None,
+                    "year": end_date.get("year"),
+                    "month": end_date.get("month")
+                } if end_date else None,
                 "description": exp.get("description", "")
             }
             experiences.append(experience)
@@ -269,16 +595,18 @@ def clean_profile_data(profile_data: Dict[str, Any]) -> Dict[str, Any]:
         # Extract education
         education = []
         for edu in profile_data.get("education", []):
+            time_period = edu.get("timePeriod")
+            end_date = _dig(time_period, "endDate")
             education_item = {
                 "school": edu.get("schoolName", ""),
                 "degree": edu.get("degreeName", ""),
                 "field_of_study": edu.get("fieldOfStudy", ""),
                 "starts_at": {
-                    "year": edu.get("timePeriod", {}).get("startDate", {}).get("year")
+                    "year": _dig(time_period, "startDate", "year")
                 },
                 "ends_at": {
-                    "year": edu.get("timePeriod", {}).get("endDate", {}).get("year")
-                } if edu.get("timePeriod", {}).get("endDate") else None
+                    "year": end_date.get("year")
+                } if end_date else None
             }
             education.append(education_item)
         cleaned["education"] = education
@@ -292,14 +620,12 @@ def clean_profile_data(profile_data: Dict[str, Any]) -> Dict[str, Any]:
                 skills.append(str(skill))
         cleaned["skills"] = skills
         
-        # Remove empty values
-        cleaned = {
-            k: v for k, v in cleaned.items()
-            if v not in ([], "", None, {})
-        }
+        # Remove empty values - a plain truthiness check covers [], "",
+        # None and {} without the per-key membership scan over a tuple
+        cleaned = {k: v for k, v in cleaned.items() if v}
         
         return cleaned
         
     except Exception as e:
-        logger.error(f"Error cleaning profile data: {e}")
+        logger.error("Error cleaning profile data: %s", e)
         return profile_data
\ No newline at end of file
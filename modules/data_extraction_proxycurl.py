@@ -0,0 +1,175 @@
+"""Module for extracting LinkedIn profile data via the ProxyCurl API.
+
+The main extraction path uses the free linkedin-api library (see
+data_extraction.py); this module keeps the paid ProxyCurl backend
+available, including an async variant that fans out batched profile
+fetches concurrently since the workload is entirely network-bound.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Try to import aiohttp for the concurrent batch path
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Try to import backoff for exponential-backoff retries
+try:
+    import backoff
+    BACKOFF_AVAILABLE = True
+except ImportError:
+    BACKOFF_AVAILABLE = False
+
+import config
+from modules.data_extraction import _loads
+
+logger = logging.getLogger(__name__)
+
+# ProxyCurl person-profile endpoint
+PROXYCURL_ENDPOINT = "https://nubela.co/proxycurl/api/v2/linkedin"
+
+# Shared session with a pooled adapter so successive fetches reuse
+# keep-alive connections instead of a fresh TCP+TLS handshake per call,
+# with retries on transient server/rate-limit errors
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+    ),
+))
+
+def _is_permanent_error(error: Exception) -> bool:
+    """Return True for errors that retrying cannot fix (auth, not found)."""
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    return status in (401, 403, 404)
+
+def _proxycurl_get(api_key: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Issue one ProxyCurl GET through the pooled session and parse it.
+
+    Streams the body into a bytearray as it arrives (overlapping network
+    wait with buffering instead of letting requests accumulate the full
+    payload first) and hands the raw bytes to the orjson-backed parser.
+    """
+    with _SESSION.get(
+        PROXYCURL_ENDPOINT,
+        headers={"Authorization": f"Bearer {api_key}"},
+        params=params,
+        timeout=30,
+        stream=True,
+    ) as response:
+        response.raise_for_status()
+        buf = bytearray()
+        for chunk in response.iter_content(65536):
+            buf.extend(chunk)
+    return _loads(bytes(buf))
+
+if BACKOFF_AVAILABLE:
+    # Retry transient failures (rate limits, 5xx, network blips) with
+    # exponential backoff + jitter; give up immediately on auth/404
+    _proxycurl_get = backoff.on_exception(
+        backoff.expo,
+        requests.exceptions.RequestException,
+        max_tries=5,
+        jitter=backoff.full_jitter,
+        giveup=_is_permanent_error,
+    )(_proxycurl_get)
+
+def extract_linkedin_profile(linkedin_profile_url: str, api_key: Optional[str] = None) -> Dict[str, Any]:
+    """Extract a single LinkedIn profile via ProxyCurl.
+
+    Args:
+        linkedin_profile_url: The LinkedIn profile URL to extract.
+        api_key: ProxyCurl API key (falls back to config).
+
+    Returns:
+        Dictionary containing the profile data, or an error dictionary.
+    """
+    api_key = api_key or config.PROXYCURL_API_KEY
+    if not api_key:
+        return {"error": "Missing API key", "message": "PROXYCURL_API_KEY is not set."}
+
+    try:
+        return _proxycurl_get(api_key, {"url": linkedin_profile_url})
+    except Exception as e:
+        logger.error(f"ProxyCurl request failed: {e}")
+        return {"error": "Request failed", "message": str(e)}
+
+async def _fetch_profile(session: "aiohttp.ClientSession", url: str,
+                         sem: asyncio.Semaphore) -> Dict[str, Any]:
+    """Fetch one profile inside the shared session, bounded by the semaphore."""
+    async with sem:
+        try:
+            async with session.get(
+                PROXYCURL_ENDPOINT, params={"url": url}, timeout=30
+            ) as response:
+                response.raise_for_status()
+                # Read raw bytes and parse with orjson when available,
+                # matching the sync path
+                return _loads(await response.read())
+        except Exception as e:
+            logger.error(f"ProxyCurl request failed for {url}: {e}")
+            return {"error": "Request failed", "message": str(e)}
+
+async def extract_linkedin_profiles_async(
+    urls: List[str],
+    api_key: Optional[str] = None,
+    concurrency: int = 8,
+) -> List[Dict[str, Any]]:
+    """Extract multiple LinkedIn profiles concurrently via ProxyCurl.
+
+    Fans requests out with asyncio.gather under a bounded semaphore, so
+    wall-clock time is roughly one request latency instead of the sum of
+    N sequential round trips.
+
+    Args:
+        urls: LinkedIn profile URLs to extract.
+        api_key: ProxyCurl API key (falls back to config).
+        concurrency: Maximum in-flight requests.
+
+    Returns:
+        List of profile dictionaries in the same order as urls.
+    """
+    api_key = api_key or config.PROXYCURL_API_KEY
+    if not api_key:
+        return [{"error": "Missing API key", "message": "PROXYCURL_API_KEY is not set."}] * len(urls)
+
+    if not AIOHTTP_AVAILABLE:
+        logger.warning("aiohttp not installed, fetching profiles sequentially")
+        return [extract_linkedin_profile(url, api_key) for url in urls]
+
+    sem = asyncio.Semaphore(concurrency)
+    async with aiohttp.ClientSession(
+        headers={"Authorization": f"Bearer {api_key}"}
+    ) as session:
+        return list(await asyncio.gather(
+            *[_fetch_profile(session, url, sem) for url in urls]
+        ))
+
+def extract_linkedin_profiles(
+    urls: List[str],
+    api_key: Optional[str] = None,
+    concurrency: int = 8,
+) -> List[Dict[str, Any]]:
+    """Synchronous wrapper around extract_linkedin_profiles_async.
+
+    Args:
+        urls: LinkedIn profile URLs to extract.
+        api_key: ProxyCurl API key (falls back to config).
+        concurrency: Maximum in-flight requests.
+
+    Returns:
+        List of profile dictionaries in the same order as urls.
+    """
+    return asyncio.run(extract_linkedin_profiles_async(urls, api_key, concurrency))
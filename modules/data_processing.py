@@ -4,14 +4,90 @@ import json
 import logging
 from typing import Dict, List, Any, Optional
 
-from llama_index.core import Document, VectorStoreIndex
+from llama_index.core import Document, StorageContext, VectorStoreIndex
 from llama_index.core.node_parser import SentenceSplitter
+from llama_index.core.schema import MetadataMode
+
+# Try to import Redis support, fall back to in-memory storage if unavailable
+try:
+    import redis
+    from llama_index.vector_stores.redis import RedisVectorStore
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Try to import FAISS for quantized embedding storage
+try:
+    import faiss
+    from llama_index.vector_stores.faiss import FaissVectorStore
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
 
 from modules.llm_interface import get_embed_model
 import config
 
 logger = logging.getLogger(__name__)
 
+def _use_redis() -> bool:
+    """Check whether the Redis-backed session store should be used."""
+    return bool(config.REDIS_URL) and REDIS_AVAILABLE
+
+def _get_redis_vector_store(session_id: str) -> "RedisVectorStore":
+    """Build a RedisVectorStore for the given session.
+
+    Args:
+        session_id: Unique session identifier used as the index name.
+
+    Returns:
+        RedisVectorStore configured with HNSW indexing and cosine distance.
+    """
+    return RedisVectorStore(
+        index_name=f"session:{session_id}",
+        redis_url=config.REDIS_URL,
+        algorithm="HNSW",
+        distance_metric="COSINE",
+    )
+
+def _expire_session_keys(session_id: str) -> None:
+    """Apply the session TTL to the store's document keys in Redis.
+
+    RedisVectorStore writes each document under a key prefixed with the
+    index name, so EXPIRE must target those per-document keys - the index
+    name itself is not a key and expiring it does nothing.
+
+    Args:
+        session_id: Session identifier the index was created under.
+    """
+    try:
+        redis_client = redis.Redis.from_url(config.REDIS_URL)
+        touched = 0
+        for key in redis_client.scan_iter(match=f"session:{session_id}:*", count=500):
+            redis_client.expire(key, config.SESSION_TTL)
+            touched += 1
+        if touched:
+            logger.info(f"Set TTL on {touched} Redis keys for session {session_id}")
+        else:
+            logger.warning(
+                f"No Redis keys matched session {session_id}; TTL not applied"
+            )
+    except Exception as e:
+        logger.warning(f"Could not set TTL for session {session_id}: {e}")
+
+def refresh_session_ttl(session_id: Optional[str]) -> None:
+    """Re-apply the session TTL to a session's Redis document keys.
+
+    Call this after writing more nodes into an existing session's store
+    (e.g. via insert_nodes) - keys written after create_vector_database
+    applied the TTL would otherwise never expire. A no-op when Redis is
+    not in use.
+
+    Args:
+        session_id: Session identifier the index was created under.
+    """
+    if session_id and _use_redis():
+        _expire_session_keys(session_id)
+
 def split_profile_data(profile_data: Dict[str, Any]) -> List:
     """Splits the LinkedIn profile JSON data into nodes.
     
@@ -38,12 +114,48 @@ def split_profile_data(profile_data: Dict[str, Any]) -> List:
         logger.error(f"Error in split_profile_data: {e}")
         return []
 
-def create_vector_database(nodes: List) -> Optional[VectorStoreIndex]:
+def _get_faiss_storage_context(nodes: List) -> Optional[StorageContext]:
+    """Build a FAISS int8 scalar-quantized store for pre-embedded nodes.
+
+    Stores embeddings at one byte per dimension instead of four, cutting
+    vector memory 4x with near-identical recall on the small per-profile
+    corpora this app indexes. Requires every node to carry a precomputed
+    embedding (the quantizer is trained on them).
+
+    Args:
+        nodes: Document nodes with .embedding already populated.
+
+    Returns:
+        StorageContext backed by FAISS, or None if quantization cannot
+        be applied to these nodes.
+    """
+    embeddings = [node.embedding for node in nodes]
+    if not embeddings or any(embedding is None for embedding in embeddings):
+        return None
+    try:
+        import numpy as np
+        matrix = np.asarray(embeddings, dtype="float32")
+        faiss_index = faiss.IndexScalarQuantizer(
+            matrix.shape[1], faiss.ScalarQuantizer.QT_8bit
+        )
+        faiss_index.train(matrix)
+        vector_store = FaissVectorStore(faiss_index=faiss_index)
+        return StorageContext.from_defaults(vector_store=vector_store)
+    except Exception as e:
+        logger.warning(f"Could not build quantized FAISS store: {e}")
+        return None
+
+def create_vector_database(nodes: List, session_id: Optional[str] = None) -> Optional[VectorStoreIndex]:
     """Stores the document chunks (nodes) in a vector database.
-    
+
+    When a session_id is provided and Redis is configured, the index is
+    stored in Redis (keyed by session) so it is shared across app replicas
+    and survives restarts. Otherwise an in-memory index is built.
+
     Args:
         nodes: List of document nodes to be indexed.
-        
+        session_id: Optional session identifier for the Redis-backed store.
+
     Returns:
         VectorStoreIndex or None if indexing fails.
     """
@@ -51,19 +163,101 @@ def create_vector_database(nodes: List) -> Optional[VectorStoreIndex]:
         # Get the Gemini embedding model
         embedding_model = get_embed_model()
 
-        # Create a VectorStoreIndex from the nodes
+        if session_id and _use_redis():
+            # Store vectors in Redis, keyed by session, with a TTL
+            vector_store = _get_redis_vector_store(session_id)
+            storage_context = StorageContext.from_defaults(vector_store=vector_store)
+            index = VectorStoreIndex(
+                nodes=nodes,
+                embed_model=embedding_model,
+                storage_context=storage_context,
+                show_progress=True
+            )
+            _expire_session_keys(session_id)
+            logger.info(f"Vector database created in Redis for session {session_id}")
+            return index
+
+        # Optionally store embeddings int8-quantized in FAISS
+        if config.QUANTIZE_EMBEDDINGS and FAISS_AVAILABLE:
+            storage_context = _get_faiss_storage_context(nodes)
+            if storage_context is not None:
+                index = VectorStoreIndex(
+                    nodes=nodes,
+                    embed_model=embedding_model,
+                    storage_context=storage_context,
+                    show_progress=True
+                )
+                logger.info("Vector database created with quantized FAISS store")
+                return index
+
+        # Create an in-memory VectorStoreIndex from the nodes
         index = VectorStoreIndex(
             nodes=nodes,
             embed_model=embedding_model,
             show_progress=True
         )
-        
+
         logger.info("Vector database created successfully")
         return index
     except Exception as e:
         logger.error(f"Error in create_vector_database: {e}")
         return None
 
+def load_vector_database(session_id: str) -> Optional[VectorStoreIndex]:
+    """Rehydrates a session's vector index from the Redis store.
+
+    Args:
+        session_id: Session identifier used when the index was created.
+
+    Returns:
+        VectorStoreIndex or None if Redis is not configured or loading fails.
+    """
+    if not _use_redis():
+        return None
+    try:
+        vector_store = _get_redis_vector_store(session_id)
+        index = VectorStoreIndex.from_vector_store(
+            vector_store,
+            embed_model=get_embed_model()
+        )
+        logger.info(f"Vector database loaded from Redis for session {session_id}")
+        return index
+    except Exception as e:
+        logger.error(f"Error in load_vector_database: {e}")
+        return None
+
+async def acreate_vector_database(nodes: List, session_id: Optional[str] = None) -> Optional[VectorStoreIndex]:
+    """Async variant of create_vector_database.
+
+    Embeds all nodes concurrently with a single batched async call before
+    building the index, so wall-clock time is bounded by the slowest
+    embedding batch instead of the sum of sequential round trips, and the
+    event loop stays free to service other users during the awaits.
+
+    Args:
+        nodes: List of document nodes to be indexed.
+        session_id: Optional session identifier for the Redis-backed store.
+
+    Returns:
+        VectorStoreIndex or None if indexing fails.
+    """
+    try:
+        embedding_model = get_embed_model()
+
+        # Embed all node texts concurrently in one batched call
+        texts = [node.get_content(metadata_mode=MetadataMode.EMBED) for node in nodes]
+        embeddings = await embedding_model.aget_text_embedding_batch(texts, show_progress=False)
+
+        # Attach the precomputed embeddings so index construction does not
+        # re-embed the nodes synchronously
+        for node, embedding in zip(nodes, embeddings):
+            node.embedding = embedding
+
+        return create_vector_database(nodes, session_id=session_id)
+    except Exception as e:
+        logger.error(f"Error in acreate_vector_database: {e}")
+        return None
+
 def verify_embeddings(index: VectorStoreIndex) -> bool:
     """Verify that all nodes have been properly embedded.
     
@@ -74,24 +268,26 @@ def verify_embeddings(index: VectorStoreIndex) -> bool:
         True if all embeddings are valid, False otherwise.
     """
     try:
+        import numpy as np
+
         vector_store = index._storage_context.vector_store
         node_ids = list(index.index_struct.nodes_dict.keys())
-        missing_embeddings = False
-
-        for node_id in node_ids:
-            embedding = vector_store.get(node_id)
-            if embedding is None:
-                logger.warning(f"Node ID {node_id} has a None embedding.")
-                missing_embeddings = True
-            else:
-                logger.debug(f"Node ID {node_id} has a valid embedding.")
-        
-        if missing_embeddings:
-            logger.warning("Some node embeddings are missing")
+        embeddings = [vector_store.get(node_id) for node_id in node_ids]
+
+        missing = [node_id for node_id, embedding in zip(node_ids, embeddings)
+                   if embedding is None]
+        if missing:
+            logger.warning(f"{len(missing)} node embeddings are missing: {missing[:5]}")
             return False
-        else:
-            logger.info("All node embeddings are valid")
-            return True
+
+        # Single vectorized reduction instead of a per-node Python loop
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        if not np.all(np.linalg.norm(matrix, axis=1) > 0):
+            logger.warning("Some node embeddings are zero vectors")
+            return False
+
+        logger.info("All node embeddings are valid")
+        return True
     except Exception as e:
         logger.error(f"Error in verify_embeddings: {e}")
         return False
\ No newline at end of file
@@ -2,6 +2,7 @@
 
 import os
 import logging
+import threading
 from typing import Optional
 
 # LlamaIndex imports for Gemini
@@ -18,6 +19,50 @@ logger = logging.getLogger(__name__)
 _current_llm = None
 _current_embed_model = None
 
+# Guards lazy initialization against concurrent first calls
+_init_lock = threading.Lock()
+
+# Cache of constructed LLM clients keyed by model ID, so switching models
+# reuses a warm client (and its HTTP connection pool) instead of paying
+# client construction on the request path
+_llm_cache = {}
+
+def _get_cached_llm(model_id: str):
+    """Get (or construct and cache) a GoogleGenAI client for a model ID.
+
+    Args:
+        model_id: Gemini model ID (e.g., "gemini-2.5-flash")
+
+    Returns:
+        GoogleGenAI: Cached client instance for the model
+    """
+    llm = _llm_cache.get(model_id)
+    if llm is None:
+        logger.info("Constructing Gemini LLM client for model: %s", model_id)
+        llm = GoogleGenAI(
+            model=model_id,
+            api_key=config.GEMINI_API_KEY,
+            temperature=config.LLM_TEMPERATURE,
+            max_tokens=config.MAX_TOKENS,
+        )
+        _llm_cache[model_id] = llm
+    return llm
+
+def warm_llm_cache(model_ids):
+    """Pre-construct LLM clients for the given model IDs.
+
+    Intended to be called from a background thread at app startup so the
+    first user request hits a warm client for any model in the dropdown.
+
+    Args:
+        model_ids: Iterable of Gemini model IDs to warm.
+    """
+    for model_id in model_ids:
+        try:
+            _get_cached_llm(model_id)
+        except Exception as e:
+            logger.warning("Could not warm LLM client for %s: %s", model_id, e)
+
 def initialize_gemini_models(
     model_id: Optional[str] = None,
     embedding_model: Optional[str] = None,
@@ -54,7 +99,7 @@ def initialize_gemini_models(
         )
     
     try:
-        logger.info(f"Initializing Gemini LLM with model: {model_id}")
+        logger.info("Initializing Gemini LLM with model: %s", model_id)
         
         # Initialize Gemini LLM
         llm = GoogleGenAI(
@@ -63,13 +108,16 @@ def initialize_gemini_models(
             temperature=temperature,
             max_tokens=max_tokens,
         )
+        _llm_cache.setdefault(model_id, llm)
+
+        logger.info("Initializing Gemini Embedding model: %s", embedding_model)
         
-        logger.info(f"Initializing Gemini Embedding model: {embedding_model}")
-        
-        # Initialize Gemini Embedding model
+        # Initialize Gemini Embedding model, batching nodes per request
+        # instead of one round trip per node
         embed_model = GoogleGenAIEmbedding(
             model_name=embedding_model,
             api_key=api_key,
+            embed_batch_size=config.EMBED_BATCH_SIZE,
         )
         
         # Set global models in LlamaIndex Settings
@@ -87,7 +135,7 @@ def initialize_gemini_models(
         return llm, embed_model
         
     except Exception as e:
-        logger.error(f"Failed to initialize Gemini models: {e}")
+        logger.error("Failed to initialize Gemini models: %s", e)
         raise
 
 def get_llm():
@@ -99,11 +147,13 @@ def get_llm():
         GoogleGenAI: Current LLM instance
     """
     global _current_llm
-    
+
     if _current_llm is None:
-        logger.info("LLM not initialized, initializing now...")
-        initialize_gemini_models()
-    
+        with _init_lock:
+            if _current_llm is None:
+                logger.info("LLM not initialized, initializing now...")
+                initialize_gemini_models()
+
     return _current_llm
 
 def get_embed_model():
@@ -115,11 +165,13 @@ def get_embed_model():
         GoogleGenAIEmbedding: Current embedding model instance
     """
     global _current_embed_model
-    
+
     if _current_embed_model is None:
-        logger.info("Embedding model not initialized, initializing now...")
-        initialize_gemini_models()
-    
+        with _init_lock:
+            if _current_embed_model is None:
+                logger.info("Embedding model not initialized, initializing now...")
+                initialize_gemini_models()
+
     return _current_embed_model
 
 def change_llm_model(model_id: str):
@@ -130,54 +182,71 @@ def change_llm_model(model_id: str):
         model_id: New Gemini model ID to use
     """
     global _current_llm
-    
-    logger.info(f"Changing LLM model to: {model_id}")
-    
+
+    logger.info("Changing LLM model to: %s", model_id)
+
     try:
-        # Create new LLM with the specified model
-        llm = GoogleGenAI(
-            model=model_id,
-            api_key=config.GEMINI_API_KEY,
-            temperature=config.LLM_TEMPERATURE,
-            max_tokens=config.MAX_TOKENS,
-        )
-        
+        # Reuse (or construct and cache) the client for this model
+        llm = _get_cached_llm(model_id)
+
         # Update global settings
         Settings.llm = llm
         _current_llm = llm
-        
-        logger.info(f"Successfully changed LLM model to: {model_id}")
-        
+
+        logger.info("Successfully changed LLM model to: %s", model_id)
+
     except Exception as e:
-        logger.error(f"Failed to change LLM model: {e}")
+        logger.error("Failed to change LLM model: %s", e)
         raise
 
-def test_gemini_connection():
+# Cached result of the one paid connectivity probe this process needs;
+# None until the first probe runs
+_gemini_probe_result: Optional[bool] = None
+
+def record_gemini_probe(result: bool) -> None:
+    """Seed the cached probe result from an external connectivity check.
+
+    Lets callers that already exercised the API (e.g., test_gemini.py)
+    share their outcome so probe_gemini() skips a second paid call.
     """
-    Test the connection to Gemini API.
-    
+    global _gemini_probe_result
+    _gemini_probe_result = bool(result)
+
+def probe_gemini() -> bool:
+    """Probe Gemini connectivity, at most once per process.
+
     Returns:
-        bool: True if connection successful, False otherwise
+        bool: True if the probe round trip succeeded, False otherwise
     """
+    global _gemini_probe_result
+
+    if _gemini_probe_result is not None:
+        return _gemini_probe_result
+
     try:
         llm = get_llm()
-        
+
         # Test with a simple prompt
         response = llm.complete("Say 'Hello' in one word.")
-        
-        logger.info(f"Gemini connection test successful. Response: {response.text}")
-        return True
-        
+
+        logger.info("Gemini connection test successful. Response: %s", response.text)
+        _gemini_probe_result = True
+
     except Exception as e:
-        logger.error(f"Gemini connection test failed: {e}")
-        return False
-
-# Initialize models on module import
-try:
-    if config.GEMINI_API_KEY:
-        initialize_gemini_models()
-        logger.info("Gemini models initialized successfully on import")
-    else:
-        logger.warning("GEMINI_API_KEY not found. Models will be initialized on first use.")
-except Exception as e:
-    logger.warning(f"Could not initialize models on import: {e}")
\ No newline at end of file
+        logger.error("Gemini connection test failed: %s", e)
+        _gemini_probe_result = False
+
+    return _gemini_probe_result
+
+def test_gemini_connection():
+    """
+    Test the connection to Gemini API.
+
+    Returns:
+        bool: True if connection successful, False otherwise
+    """
+    return probe_gemini()
+
+# Models are initialized lazily on first use (get_llm / get_embed_model)
+# rather than at import time, so importing this module stays fast for
+# CLIs, tests and workers that never touch the LLM.
\ No newline at end of file
@@ -1,121 +1,254 @@
 """Module for querying indexed LinkedIn profile data."""
 
 import logging
+import threading
+import weakref
 from typing import Any, Dict, Optional
 
-from llama_index.core import VectorStoreIndex, PromptTemplate
+from llama_index.core import VectorStoreIndex, PromptTemplate, QueryBundle
 
-from modules.llm_interface import get_llm
+from modules.llm_interface import get_llm, get_embed_model
 import config
 
 logger = logging.getLogger(__name__)
 
+# Fallback templates used when config does not define them
+_DEFAULT_FACTS_TEMPLATE = """Context information is below.
+---------------------
+{context_str}
+---------------------
+Given the context information and not prior knowledge, provide three interesting facts about this person's career or education.
+Be specific and cite actual information from the profile. Keep each fact concise (1-2 sentences).
+
+Facts:
+"""
+
+_DEFAULT_QUESTION_TEMPLATE = """Context information is below.
+---------------------
+{context_str}
+---------------------
+Given the context information and not prior knowledge, answer the question: {query_str}
+
+If the answer is not in the context, say "I don't have enough information to answer that question."
+
+Answer:
+"""
+
+# Prompt templates compiled once at import time - every query used to
+# re-run a getattr fallback chain and re-parse the template string per
+# call. This module already requires llama-index, so the templates are
+# compiled here rather than in the dependency-free config module.
+_FACTS_PROMPT = PromptTemplate(
+    template=getattr(config, 'INITIAL_FACTS_TEMPLATE', _DEFAULT_FACTS_TEMPLATE))
+_QUESTION_PROMPT = PromptTemplate(
+    template=getattr(config, 'USER_QUESTION_TEMPLATE', _DEFAULT_QUESTION_TEMPLATE))
+
+# Query engines cached per index (weakly, so evicted sessions free their
+# engines too), keyed by prompt/streaming/LLM. Rebuilding an engine on
+# every call reconstructs the whole retriever + synthesizer pipeline.
+_engine_cache = weakref.WeakKeyDictionary()
+_engine_cache_lock = threading.Lock()
+
+def _get_query_engine(index: VectorStoreIndex, prompt: PromptTemplate,
+                      prompt_key: str, streaming: bool = False):
+    """Get (or build and cache) a query engine for the index and prompt.
+
+    Args:
+        index: VectorStoreIndex to query.
+        prompt: Prompt template for the engine.
+        prompt_key: Stable name identifying the template.
+        streaming: Whether the engine should stream responses.
+
+    Returns:
+        Cached or newly built query engine.
+    """
+    gemini_llm = get_llm()
+    cache_key = (prompt_key, streaming, id(gemini_llm))
+
+    with _engine_cache_lock:
+        engines = _engine_cache.get(index)
+        if engines is None:
+            engines = {}
+            _engine_cache[index] = engines
+        engine = engines.get(cache_key)
+        if engine is None:
+            engine = index.as_query_engine(
+                streaming=streaming,
+                similarity_top_k=config.SIMILARITY_TOP_K,
+                llm=gemini_llm,
+                text_qa_template=prompt
+            )
+            engines[cache_key] = engine
+        return engine
+
+def _build_query_bundle(user_query: str, query_embedding=None) -> QueryBundle:
+    """Build a QueryBundle carrying a precomputed query embedding.
+
+    Embedding the query here (or reusing one the caller already has, e.g.
+    from the semantic cache) means retrieval does not issue its own
+    embedding API call for the same text.
+
+    Args:
+        user_query: The user's question.
+        query_embedding: Optional precomputed embedding for the query.
+
+    Returns:
+        QueryBundle with the query string and its embedding.
+    """
+    if query_embedding is None:
+        query_embedding = get_embed_model().get_query_embedding(user_query)
+    return QueryBundle(
+        query_str=user_query,
+        embedding=[float(value) for value in query_embedding],
+    )
+
+# Query driving the initial-facts retrieval and synthesis
+_FACTS_QUERY = "Provide three interesting facts about this person's career or education. Keep each fact brief."
+
+def _facts_error_message(error_msg: str) -> str:
+    """Map a facts-generation error to the user-facing message."""
+    if "MAX_TOKENS" in error_msg or "terminated early" in error_msg:
+        return "Profile processed successfully, but the response was too long. Try asking specific questions in the Chat tab instead."
+    elif "RATE_LIMIT" in error_msg or "quota" in error_msg.lower():
+        return "Rate limit exceeded. Please wait a moment and try again."
+    else:
+        return f"Failed to generate initial facts. Error: {error_msg}"
+
 def generate_initial_facts(index: VectorStoreIndex) -> str:
     """Generates interesting facts about the person's career or education.
-    
+
     Args:
         index: VectorStoreIndex containing the LinkedIn profile data.
-        
+
     Returns:
         String containing interesting facts about the person.
     """
     try:
-        # Get Gemini LLM
-        gemini_llm = get_llm()
-        
-        # Create prompt template
-        # Using a default template if not in config
-        facts_template = getattr(config, 'INITIAL_FACTS_TEMPLATE', 
-            """Context information is below.
----------------------
-{context_str}
----------------------
-Given the context information and not prior knowledge, provide three interesting facts about this person's career or education.
-Be specific and cite actual information from the profile. Keep each fact concise (1-2 sentences).
+        # Get the cached query engine for this index
+        query_engine = _get_query_engine(index, _FACTS_PROMPT, 'initial_facts')
 
-Facts:
-""")
-        
-        facts_prompt = PromptTemplate(template=facts_template)
-        
-        # Create query engine
-        query_engine = index.as_query_engine(
-            streaming=False,
-            similarity_top_k=config.SIMILARITY_TOP_K,
-            llm=gemini_llm,
-            text_qa_template=facts_prompt
-        )
-        
         # Execute the query
-        query = "Provide three interesting facts about this person's career or education. Keep each fact brief."
-        response = query_engine.query(query)
-        
+        response = query_engine.query(_FACTS_QUERY)
+
         # Return the facts
         return response.response
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Error in generate_initial_facts: {error_msg}")
-        
-        # Handle specific error cases
-        if "MAX_TOKENS" in error_msg or "terminated early" in error_msg:
-            return "Profile processed successfully, but the response was too long. Try asking specific questions in the Chat tab instead."
-        elif "RATE_LIMIT" in error_msg or "quota" in error_msg.lower():
-            return "Rate limit exceeded. Please wait a moment and try again."
-        else:
-            return f"Failed to generate initial facts. Error: {error_msg}"
-
-def answer_user_query(index: VectorStoreIndex, user_query: str) -> Any:
+        return _facts_error_message(error_msg)
+
+def retrieve_facts_context(index: VectorStoreIndex) -> Optional[str]:
+    """Runs only the retrieval half of initial-facts generation.
+
+    Split out from generate_initial_facts so callers can finish reading
+    the vector store before mutating the index (e.g. inserting the rest
+    of the profile's nodes) and overlap just the LLM synthesis with that
+    mutation - the default in-memory stores are not safe to read while
+    insert_nodes runs.
+
+    Args:
+        index: VectorStoreIndex containing the LinkedIn profile data.
+
+    Returns:
+        Context string for synthesize_initial_facts, or None if
+        retrieval fails.
+    """
+    try:
+        retriever = index.as_retriever(similarity_top_k=config.SIMILARITY_TOP_K)
+        source_nodes = retriever.retrieve(_FACTS_QUERY)
+        return "\n\n".join(n.node.get_text() for n in source_nodes)
+    except Exception as e:
+        logger.error(f"Error in retrieve_facts_context: {e}")
+        return None
+
+def synthesize_initial_facts(context_str: Optional[str]) -> str:
+    """Generates the initial facts from an already-retrieved context.
+
+    Args:
+        context_str: Context produced by retrieve_facts_context, or None
+            if retrieval failed.
+
+    Returns:
+        String containing interesting facts about the person.
+    """
+    if context_str is None:
+        return "Failed to generate initial facts. Error: could not retrieve profile context."
+    try:
+        return get_llm().predict(_FACTS_PROMPT, context_str=context_str)
+    except Exception as e:
+        error_msg = str(e)
+        logger.error(f"Error in synthesize_initial_facts: {error_msg}")
+        return _facts_error_message(error_msg)
+
+def answer_user_query(index: VectorStoreIndex, user_query: str,
+                      query_embedding=None) -> Any:
     """Answers the user's question using the vector database and the LLM.
-    
+
     Args:
         index: VectorStoreIndex containing the LinkedIn profile data.
         user_query: The user's question.
-        
+        query_embedding: Optional precomputed embedding for the query.
+
     Returns:
         Response object containing the answer to the user's question.
     """
     try:
-        # Get Gemini LLM
-        gemini_llm = get_llm()
-        
-        # Create prompt template
-        # Using a default template if not in config
-        question_template = getattr(config, 'USER_QUESTION_TEMPLATE',
-            """Context information is below.
----------------------
-{context_str}
----------------------
-Given the context information and not prior knowledge, answer the question: {query_str}
+        # Embed the query once; the bundle is shared by the debug
+        # retrieval and the query engine below
+        query_bundle = _build_query_bundle(user_query, query_embedding)
 
-If the answer is not in the context, say "I don't have enough information to answer that question."
+        # Retrieve relevant nodes separately only when debug logging is
+        # on - the query engine below does its own retrieval, so this
+        # would otherwise run the same vector search twice per question
+        if logger.isEnabledFor(logging.DEBUG):
+            base_retriever = index.as_retriever(similarity_top_k=config.SIMILARITY_TOP_K)
+            source_nodes = base_retriever.retrieve(query_bundle)
+            # join accepts a generator directly - no temp list needed
+            context_str = "\n\n".join(n.node.get_text() for n in source_nodes)
+            logger.debug("Retrieved %d nodes for query: %s\n%s",
+                         len(source_nodes), user_query, context_str)
+
+        # Get the cached query engine for this index
+        query_engine = _get_query_engine(index, _QUESTION_PROMPT, 'user_question')
 
-Answer:
-""")
-        
-        question_prompt = PromptTemplate(template=question_template)
-        
-        # Retrieve relevant nodes
-        base_retriever = index.as_retriever(similarity_top_k=config.SIMILARITY_TOP_K)
-        source_nodes = base_retriever.retrieve(user_query)
-        
-        # Build context string (for logging/debugging)
-        context_str = "\n\n".join([node.node.get_text() for node in source_nodes])
-        logger.debug(f"Retrieved {len(source_nodes)} nodes for query: {user_query}")
-        
-        # Create query engine
-        query_engine = index.as_query_engine(
-            streaming=False,
-            similarity_top_k=config.SIMILARITY_TOP_K,
-            llm=gemini_llm,
-            text_qa_template=question_prompt
-        )
-        
         # Execute the query
-        answer = query_engine.query(user_query)
+        answer = query_engine.query(query_bundle)
         return answer
     except Exception as e:
         logger.error(f"Error in answer_user_query: {e}")
         # Return a simple object with a response attribute for error handling
+        class ErrorResponse:
+            def __init__(self, message):
+                self.response = message
+        return ErrorResponse("Failed to get an answer. Please try again.")
+
+def stream_user_query(index: VectorStoreIndex, user_query: str,
+                      query_embedding=None):
+    """Streams the answer to the user's question token by token.
+
+    Works like answer_user_query but builds a streaming query engine, so
+    callers can iterate response.response_gen and show partial output as
+    soon as Gemini produces it instead of waiting for the full completion.
+
+    Args:
+        index: VectorStoreIndex containing the LinkedIn profile data.
+        user_query: The user's question.
+        query_embedding: Optional precomputed embedding for the query.
+
+    Returns:
+        StreamingResponse object exposing a response_gen token iterator,
+        or a plain response object with a .response string on failure.
+    """
+    try:
+        # Get the cached streaming query engine for this index
+        query_engine = _get_query_engine(index, _QUESTION_PROMPT,
+                                         'user_question', streaming=True)
+
+        # Execute the query - tokens arrive via response.response_gen
+        return query_engine.query(_build_query_bundle(user_query, query_embedding))
+    except Exception as e:
+        logger.error(f"Error in stream_user_query: {e}")
+        # Return a simple object with a response attribute for error handling
         class ErrorResponse:
             def __init__(self, message):
                 self.response = message
@@ -0,0 +1,108 @@
+"""Module providing a semantic cache for answered user queries.
+
+Caches responses keyed by the embedding of the user's query, so repeated
+or paraphrased questions ("what's their role?" vs "what role do they
+have?") are answered from cache instead of re-running retrieval plus a
+full Gemini generation.
+"""
+
+import logging
+import threading
+from collections import deque
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from modules.llm_interface import get_embed_model
+from modules import similarity
+import config
+
+# Try to import cachetools so idle sessions' caches expire with the
+# session TTL, fall back to a plain dict if unavailable
+try:
+    from cachetools import TTLCache
+    CACHETOOLS_AVAILABLE = True
+except ImportError:
+    CACHETOOLS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Per-session bounded caches of (embedding, response) pairs. Bounded
+# and TTL'd like app.active_indices - without eviction every session
+# ever seen would keep its deque of embeddings alive forever.
+if CACHETOOLS_AVAILABLE:
+    _caches = TTLCache(maxsize=config.MAX_ACTIVE_SESSIONS, ttl=config.SESSION_TTL)
+else:
+    _caches: Dict[str, deque] = {}
+_lock = threading.Lock()
+
+def _get_cache(session_id: str) -> deque:
+    """Get or create the bounded cache deque for a session."""
+    with _lock:
+        cache = _caches.get(session_id)
+        if cache is None:
+            cache = deque(maxlen=config.SEMANTIC_CACHE_SIZE)
+            _caches[session_id] = cache
+        return cache
+
+def _embed_query(query: str) -> Optional[np.ndarray]:
+    """Embed a query string, returning a float32 vector or None on failure."""
+    try:
+        embedding = get_embed_model().get_query_embedding(query)
+        return similarity.as_embedding(embedding)
+    except Exception as e:
+        logger.error(f"Error embedding query for semantic cache: {e}")
+        return None
+
+def lookup(session_id: str, query: str) -> Tuple[Optional[np.ndarray], Optional[str]]:
+    """Look up a semantically similar prior query for this session.
+
+    Args:
+        session_id: Session the query belongs to.
+        query: The user's question.
+
+    Returns:
+        Tuple of (query_embedding, cached_response). The embedding is
+        returned even on a miss so callers can pass it to store() without
+        re-embedding; cached_response is None on a miss.
+    """
+    query_embedding = _embed_query(query)
+    if query_embedding is None:
+        return None, None
+
+    cache = _get_cache(session_id)
+    if not cache:
+        return query_embedding, None
+
+    try:
+        # Stack cached embeddings into one matrix for a single vectorized
+        # similarity scan instead of a Python loop
+        entries = list(cache)
+        corpus = np.stack([embedding for embedding, _ in entries])
+        similarities = similarity.cosine_many(query_embedding, corpus)
+
+        best = int(np.argmax(similarities))
+        if similarities[best] > config.SEMANTIC_CACHE_THRESHOLD:
+            logger.info(f"Semantic cache hit (similarity={similarities[best]:.3f})")
+            return query_embedding, entries[best][1]
+    except Exception as e:
+        logger.error(f"Error in semantic cache lookup: {e}")
+
+    return query_embedding, None
+
+def store(session_id: str, query_embedding: Optional[np.ndarray], response: str) -> None:
+    """Store a query embedding and its response in the session's cache.
+
+    Args:
+        session_id: Session the query belongs to.
+        query_embedding: Embedding returned by lookup() for this query.
+        response: The generated response text to cache.
+    """
+    if query_embedding is None or not response:
+        return
+    _get_cache(session_id).append((query_embedding, response))
+
+def clear(session_id: str) -> None:
+    """Drop the cache for a session (e.g., when the session expires)."""
+    with _lock:
+        _caches.pop(session_id, None)
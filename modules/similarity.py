@@ -0,0 +1,133 @@
+"""Module providing cosine-similarity kernels for local vector scans.
+
+Uses SimSIMD's SIMD kernels (which fuse dot product and norms in a single
+vectorized pass) when the package is installed, and falls back to plain
+NumPy otherwise. Used by the semantic cache and any local reranking done
+before handing context to Gemini.
+"""
+
+import logging
+from typing import Optional
+
+import numpy as np
+
+# Try to import SimSIMD, fall back to NumPy kernels if unavailable
+try:
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    SIMSIMD_AVAILABLE = False
+
+# Try to import Numba for a JIT-compiled scoring kernel, used when
+# SimSIMD is not installed
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+if NUMBA_AVAILABLE:
+    @njit('f4[:](f4[:], f4[:, :])', cache=True, parallel=True, fastmath=True)
+    def _cosine_scores_jit(query, corpus):
+        """Fused dot + norm cosine scan over corpus rows, one pass each."""
+        n, dim = corpus.shape
+        scores = np.empty(n, dtype=np.float32)
+        query_norm = 0.0
+        for j in range(dim):
+            query_norm += query[j] * query[j]
+        query_norm = np.sqrt(query_norm)
+        for i in prange(n):
+            dot = 0.0
+            row_norm = 0.0
+            for j in range(dim):
+                dot += corpus[i, j] * query[j]
+                row_norm += corpus[i, j] * corpus[i, j]
+            denom = np.sqrt(row_norm) * query_norm
+            scores[i] = dot / denom if denom != 0.0 else 0.0
+        return scores
+
+# SimSIMD operates natively on float16, halving cached-embedding memory
+# and doubling the effective SIMD lane count; NumPy is fastest in float32
+EMBEDDING_DTYPE = np.float16 if SIMSIMD_AVAILABLE else np.float32
+
+def as_embedding(vector) -> np.ndarray:
+    """Convert an embedding to the dtype used by the similarity kernels."""
+    return np.asarray(vector, dtype=EMBEDDING_DTYPE)
+
+def cosine(a: np.ndarray, b: np.ndarray) -> float:
+    """Compute the cosine similarity between two vectors.
+
+    Args:
+        a: First embedding vector.
+        b: Second embedding vector.
+
+    Returns:
+        Cosine similarity in [-1, 1].
+    """
+    if SIMSIMD_AVAILABLE:
+        # simsimd returns the cosine *distance*; convert to similarity
+        return 1.0 - float(simsimd.cosine(a, b))
+
+    norm = np.linalg.norm(a) * np.linalg.norm(b)
+    if norm == 0:
+        return 0.0
+    return float(np.dot(a, b) / norm)
+
+def cosine_many(query: np.ndarray, corpus: np.ndarray) -> np.ndarray:
+    """Compute cosine similarities between one query and a corpus matrix.
+
+    Args:
+        query: Query embedding of shape (dim,).
+        corpus: Matrix of embeddings of shape (n, dim).
+
+    Returns:
+        Array of n cosine similarities.
+    """
+    if SIMSIMD_AVAILABLE:
+        distances = simsimd.cdist(query.reshape(1, -1), corpus, metric="cosine")
+        return 1.0 - np.asarray(distances, dtype=np.float32).ravel()
+
+    query = query.astype(np.float32, copy=False)
+    corpus = np.ascontiguousarray(corpus, dtype=np.float32)
+
+    if NUMBA_AVAILABLE:
+        return _cosine_scores_jit(np.ascontiguousarray(query), corpus)
+
+    norms = np.linalg.norm(corpus, axis=1) * np.linalg.norm(query)
+    return corpus @ query / np.where(norms == 0, 1.0, norms)
+
+def warmup() -> None:
+    """Trigger JIT compilation (or cache load) of the scoring kernels.
+
+    Call once at app startup so the first user request does not pay the
+    Numba first-call compile cost. The kernel is declared with an explicit
+    signature and cache=True, so after the first run the compiled code is
+    loaded from the on-disk cache (relocatable via NUMBA_CACHE_DIR).
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    try:
+        dummy = np.zeros(768, dtype=np.float32)
+        _cosine_scores_jit(dummy, np.zeros((1, 768), dtype=np.float32))
+        logger.info("Similarity kernels warmed up")
+    except Exception as e:
+        logger.warning(f"Similarity kernel warmup failed: {e}")
+
+def topk_cosine(query: np.ndarray, corpus: np.ndarray, k: int) -> tuple:
+    """Return the indices and scores of the k most similar corpus rows.
+
+    Args:
+        query: Query embedding of shape (dim,).
+        corpus: Matrix of embeddings of shape (n, dim).
+        k: Number of results to return.
+
+    Returns:
+        Tuple of (indices, scores) arrays sorted by descending similarity.
+    """
+    scores = cosine_many(query, corpus)
+    k = min(k, scores.shape[0])
+    top = np.argpartition(scores, -k)[-k:]
+    order = top[np.argsort(scores[top])[::-1]]
+    return order, scores[order]